@@ -33,6 +33,24 @@ NAV_ITEMS = [
     ("blueprint","◉  Blueprints",      "Agent Scratchpad"),
 ]
 
+SECTION_TITLES = {
+    "vault":     ("◈  THE VAULT", "Keys · Config · Environment"),
+    "skills":    ("⊕  SKILL FACTORY", "Global Skill Registry"),
+    "project":   ("⬡  PROJECT PROVISIONER", "One-Click Agent Bootstrap"),
+    "blueprint": ("◉  BLUEPRINT GENERATOR", "Agent Scratchpad · Dynamic Markdown"),
+    "settings":  ("⚙  SETTINGS", "Application Settings"),
+}
+
+SHORTCUTS = [
+    ("F1", "The Vault"),
+    ("F2", "Skill Factory"),
+    ("F3", "Project Provisioner"),
+    ("F4", "Blueprint Generator"),
+    ("F5", "Refresh current view"),
+    ("Q", "Quit"),
+    ("?", "Show this help"),
+]
+
 
 class NebulaApp(App):
     """NEBULA-FORGE — The Agentic Orchestrator."""
@@ -107,6 +125,16 @@ class NebulaApp(App):
     # ── Lifecycle ─────────────────────────────────────────────
 
     def on_mount(self) -> None:
+        # Resolve the shell widgets once, while the main screen is still the active one
+        self._nav_buttons = {
+            section_id: self.query_one(f"#nav-{section_id}", Button)
+            for section_id, _, _ in NAV_ITEMS
+        }
+        self._top_bar_title = self.query_one("#top-bar-title", Static)
+        self._breadcrumb = self.query_one("#breadcrumb", Static)
+        self._content_area = self.query_one("#content-area", Container)
+        self._sidebar_status = self.query_one("#sidebar-status", Static)
+
         self.push_screen(SplashScreen())
         self._update_nav()
         self._load_section("vault")
@@ -120,7 +148,7 @@ class NebulaApp(App):
         self.push_screen(WizardScreen(self.vault, on_complete=self._on_wizard_done))
 
     def _on_wizard_done(self) -> None:
-        self.query_one("#sidebar-status", Static).update(self._build_status_line())
+        self._sidebar_status.update(self._build_status_line())
         self.app.notify("✓ NEBULA-FORGE initialized!", severity="information")
 
     def _build_status_line(self) -> str:
@@ -132,36 +160,19 @@ class NebulaApp(App):
     # ── Navigation ────────────────────────────────────────────
 
     def _update_nav(self) -> None:
-        for section_id, _, _ in NAV_ITEMS:
-            try:
-                btn = self.query_one(f"#nav-{section_id}", Button)
-                if section_id == self.active_section:
-                    btn.add_class("active")
-                else:
-                    btn.remove_class("active")
-            except Exception:
-                pass
+        for section_id, btn in self._nav_buttons.items():
+            btn.set_class(section_id == self.active_section, "active")
 
     def _load_section(self, section_id: str) -> None:
         self.active_section = section_id
         self._update_nav()
 
-        titles = {
-            "vault": ("◈  THE VAULT", "Keys · Config · Environment"),
-            "skills": ("⊕  SKILL FACTORY", "Global Skill Registry"),
-            "project": ("⬡  PROJECT PROVISIONER", "One-Click Agent Bootstrap"),
-            "blueprint": ("◉  BLUEPRINT GENERATOR", "Agent Scratchpad · Dynamic Markdown"),
-            "settings": ("⚙  SETTINGS", "Application Settings"),
-        }
-        title, crumb = titles.get(section_id, ("NEBULA-FORGE", ""))
+        title, crumb = SECTION_TITLES.get(section_id, ("NEBULA-FORGE", ""))
 
-        try:
-            self.query_one("#top-bar-title", Static).update(f"[bold #7dcfff]{title}[/]")
-            self.query_one("#breadcrumb", Static).update(f"[#565f89]  ›  {crumb}[/]")
-        except Exception:
-            pass
+        self._top_bar_title.update(f"[bold #7dcfff]{title}[/]")
+        self._breadcrumb.update(f"[#565f89]  ›  {crumb}[/]")
 
-        content_area = self.query_one("#content-area")
+        content_area = self._content_area
         content_area.remove_children()
 
         if section_id == "vault":
@@ -177,15 +188,6 @@ class NebulaApp(App):
 
     def _build_settings(self) -> Container:
         cfg = self.vault.load()
-        shortcuts = [
-            ("F1", "The Vault"),
-            ("F2", "Skill Factory"),
-            ("F3", "Project Provisioner"),
-            ("F4", "Blueprint Generator"),
-            ("F5", "Refresh current view"),
-            ("Q", "Quit"),
-            ("?", "Show this help"),
-        ]
         return ScrollableContainer(
             Static("[bold #7dcfff]Application Settings[/]\n"),
             Static(
@@ -195,7 +197,7 @@ class NebulaApp(App):
                 f"[#bb9af7]Default Model:[/]  [#7aa2f7]{cfg.default_model}[/]\n"
             ),
             Static("[bold #7dcfff]Keyboard Shortcuts[/]\n"),
-            *[Static(f"  [bold #7aa2f7]{key:6}[/]  [#c0caf5]{action}[/]") for key, action in shortcuts],
+            *[Static(f"  [bold #7aa2f7]{key:6}[/]  [#c0caf5]{action}[/]") for key, action in SHORTCUTS],
             classes="panel",
         )
 
@@ -299,6 +299,18 @@ OPENCODE_PLUGINS: List[OpenCodePlugin] = [
 ]
 
 
+def _group_by_category(plugins: List[OpenCodePlugin]) -> Dict[str, List[OpenCodePlugin]]:
+    """Group plugins by category, preserving catalogue order."""
+    grouped: Dict[str, List[OpenCodePlugin]] = {}
+    for plugin in plugins:
+        grouped.setdefault(plugin.category, []).append(plugin)
+    return grouped
+
+
+PLUGINS_BY_CATEGORY: Dict[str, List[OpenCodePlugin]] = _group_by_category(OPENCODE_PLUGINS)
+PLUGINS_BY_NAME: Dict[str, OpenCodePlugin] = {p.name: p for p in OPENCODE_PLUGINS}
+
+
 class ProvisionEntry(BaseModel):
     path: str
     content: str
@@ -5,8 +5,10 @@ All file/folder creation logic with Ghost Provisioning (diff preview).
 
 from __future__ import annotations
 import json
+import os
 import shutil
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
@@ -320,6 +322,43 @@ OPENCODE_JSON_TEMPLATE = """\
 }"""
 
 
+# Root-relative paths probed by detect_project
+DETECT_PROBES = (
+    ".git", "package.json", "tsconfig.json", "pyproject.toml", "setup.py",
+    "go.mod", "Cargo.toml", "Dockerfile",
+    "AGENTS.md", "opencode.json", ".opencode",
+    "CLAUDE.md", "gemini.json", ".nebula/agents",
+)
+
+# Probes whose files plan_project_bootstrap creates when missing — a miss here
+# is confirmed with exists() so a case-only mismatch never means an overwrite
+DETECT_CONFIRM_MISSES = ("AGENTS.md", "opencode.json")
+
+
+def _scandir_names(path: Path) -> set[str] | None:
+    """Entry names of a directory from a single readdir; None if unreadable."""
+    try:
+        with os.scandir(path) as it:
+            return {e.name for e in it}
+    except OSError:
+        return None
+
+
+def split_entry_path(path: str) -> tuple[str, str, bool]:
+    """(parent, name, has_suffix) of a plan entry path, without building a Path."""
+    parent, _, name = path.rpartition(os.sep)
+    return parent, name, 0 < name.rfind(".") < len(name) - 1
+
+
+@lru_cache(maxsize=32)
+def _read_mcp_names(target: str, mtime_ns: int, size: int) -> tuple[str, ...]:
+    """Parse the mcp section of an opencode.json; keyed on mtime/size so edits re-parse."""
+    try:
+        return tuple(json.loads(Path(target).read_text()).get("mcp", {}).keys())
+    except Exception:
+        return ()
+
+
 class Provisioner:
     """
     Handles all file system operations for NEBULA-FORGE.
@@ -328,6 +367,8 @@ class Provisioner:
 
     def __init__(self, vault: Vault) -> None:
         self.vault = vault
+        # Keys of writes still running in a thread — see screens/guarded_write.py
+        self.writes_in_flight: set[str] = set()
 
     # ── Skill Factory ────────────────────────────────────────
 
@@ -401,7 +442,10 @@ class Provisioner:
         dst_file = dst_dir / "SKILL.md"
         src_file = src / "SKILL.md"
 
-        content = src_file.read_text() if src_file.exists() else "# Skill copied"
+        try:
+            content = src_file.read_text()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            content = "# Skill copied"
 
         return ProvisionPlan(
             title=f"Copy Skill '{skill_name}' → Project",
@@ -422,8 +466,26 @@ class Provisioner:
     # ── Project Provisioner ──────────────────────────────────
 
     def detect_project(self, path: Path) -> ProjectContext:
+        # One readdir of the root answers every top-level probe; nested probes
+        # (.nebula/agents) cost a second readdir only when their parent exists.
+        # A directory that can't be listed falls back to probing each path.
+        root = _scandir_names(path)
+        found: dict[str, bool] = {}
+        for rel in DETECT_PROBES:
+            parent, _, leaf = rel.rpartition("/")
+            names = root
+            if parent and names is not None:
+                names = _scandir_names(path / parent) if parent in root else set()
+            if names is None:
+                found[rel] = os.path.exists(path / rel)
+            else:
+                found[rel] = leaf in names
+        for rel in DETECT_CONFIRM_MISSES:
+            if not found[rel]:
+                found[rel] = os.path.exists(path / rel)
+
         stack = []
-        if (path / "package.json").exists():
+        if found["package.json"]:
             stack.append("Node.js")
             try:
                 pkg = json.loads((path / "package.json").read_text())
@@ -432,25 +494,25 @@ class Provisioner:
                     stack.append("React")
                 if "next" in deps:
                     stack.append("Next.js")
-                if "typescript" in deps or (path / "tsconfig.json").exists():
+                if "typescript" in deps or found["tsconfig.json"]:
                     stack.append("TypeScript")
             except Exception:
                 pass
 
-        if (path / "pyproject.toml").exists() or (path / "setup.py").exists():
+        if found["pyproject.toml"] or found["setup.py"]:
             stack.append("Python")
-            if (path / "pyproject.toml").exists():
+            if found["pyproject.toml"]:
                 content = (path / "pyproject.toml").read_text()
                 if "fastapi" in content.lower():
                     stack.append("FastAPI")
                 if "django" in content.lower():
                     stack.append("Django")
 
-        if (path / "go.mod").exists():
+        if found["go.mod"]:
             stack.append("Go")
-        if (path / "Cargo.toml").exists():
+        if found["Cargo.toml"]:
             stack.append("Rust")
-        if (path / "Dockerfile").exists():
+        if found["Dockerfile"]:
             stack.append("Docker")
 
         available_skills = [s.name for s in self.vault.list_global_skills()]
@@ -458,17 +520,17 @@ class Provisioner:
         return ProjectContext(
             path=str(path),
             name=path.name,
-            has_git=(path / ".git").exists(),
-            has_package_json=(path / "package.json").exists(),
-            has_pyproject=(path / "pyproject.toml").exists(),
+            has_git=found[".git"],
+            has_package_json=found["package.json"],
+            has_pyproject=found["pyproject.toml"],
             # OpenCode-first
-            has_agents_md=(path / "AGENTS.md").exists(),
-            has_opencode_json=(path / "opencode.json").exists(),
-            has_opencode_dir=(path / ".opencode").exists(),
+            has_agents_md=found["AGENTS.md"],
+            has_opencode_json=found["opencode.json"],
+            has_opencode_dir=found[".opencode"],
             # Legacy compat
-            has_claude_md=(path / "CLAUDE.md").exists(),
-            has_gemini_json=(path / "gemini.json").exists(),
-            has_nebula_agents=(path / ".nebula" / "agents").exists(),
+            has_claude_md=found["CLAUDE.md"],
+            has_gemini_json=found["gemini.json"],
+            has_nebula_agents=found[".nebula/agents"],
             detected_stack=stack,
             available_skills=available_skills,
         )
@@ -532,17 +594,21 @@ class Provisioner:
             src = self.vault.skills_dir / skill_name / "SKILL.md"
             dst_dir = project_path / skills_subdir / skill_name
             dst_file = dst_dir / "SKILL.md"
-            if src.exists():
-                entries.append(ProvisionEntry(
-                    path=str(dst_dir), content="", action="create",
-                    description=f"Skills dir: {skills_subdir}/{skill_name}/",
-                ))
-                entries.append(ProvisionEntry(
-                    path=str(dst_file),
-                    content=src.read_text(),
-                    action="symlink",
-                    description=f"Inject skill: {skill_name}",
-                ))
+            # One open() instead of exists() + read — a missing skill is simply skipped
+            try:
+                content = src.read_text()
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                continue
+            entries.append(ProvisionEntry(
+                path=str(dst_dir), content="", action="create",
+                description=f"Skills dir: {skills_subdir}/{skill_name}/",
+            ))
+            entries.append(ProvisionEntry(
+                path=str(dst_file),
+                content=content,
+                action="symlink",
+                description=f"Inject skill: {skill_name}",
+            ))
 
         return ProvisionPlan(
             title=f"Bootstrap Project: {ctx.name}",
@@ -642,12 +708,11 @@ class Provisioner:
             target = Path.home() / ".config" / "opencode" / "opencode.json"
         else:
             target = project_path / "opencode.json"
-        if not target.exists():
-            return []
         try:
-            return list(json.loads(target.read_text()).get("mcp", {}).keys())
-        except Exception:
+            st = target.stat()
+        except OSError:
             return []
+        return list(_read_mcp_names(str(target), st.st_mtime_ns, st.st_size))
 
     # ── Blueprint Generator ──────────────────────────────────
 
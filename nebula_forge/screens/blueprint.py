@@ -9,7 +9,7 @@ from pathlib import Path
 from textual.app import ComposeResult
 from textual.widgets import (
     Button, Input, Static, TabbedContent, TabPane,
-    TextArea, Select, ProgressBar
+    TextArea, Select, ProgressBar, RichLog
 )
 from textual.containers import (
     Vertical, Horizontal, Container, ScrollableContainer, Grid
@@ -110,6 +110,8 @@ TEMPLATES: list[BlueprintTemplate] = [
     ),
 ]
 
+TEMPLATES_BY_ID: dict[str, BlueprintTemplate] = {t.id: t for t in TEMPLATES}
+
 
 class BlueprintScreen(Container):
     """Blueprint Generator — high-fidelity SWE markdown with agent triggers."""
@@ -207,7 +209,7 @@ class BlueprintScreen(Container):
 
         if bid.startswith("select-tmpl-"):
             tmpl_id = bid[12:]
-            tmpl = next((t for t in TEMPLATES if t.id == tmpl_id), None)
+            tmpl = TEMPLATES_BY_ID.get(tmpl_id)
             if tmpl:
                 self._current_template = tmpl
                 self._load_configure(tmpl)
@@ -256,10 +258,12 @@ class BlueprintScreen(Container):
     async def run_generate(self, tmpl_id: str, variables: dict, project_name: str) -> None:
         try:
             preview_view = self.query_one("#preview-view")
-            preview_view.remove_children()
-            preview_view.mount(Static("[#7dcfff]Generating blueprint...[/]"))
+            await preview_view.remove_children()
             pb = ProgressBar(total=100, show_eta=False)
-            preview_view.mount(pb)
+            await preview_view.mount_all([
+                Static("[#7dcfff]Generating blueprint...[/]"),
+                pb,
+            ])
 
             for i in range(0, 101, 20):
                 pb.progress = i
@@ -268,36 +272,25 @@ class BlueprintScreen(Container):
             content = self.provisioner.generate_blueprint(tmpl_id, variables, project_name)
             self._generated_content = content
 
-            preview_view.remove_children()
+            await preview_view.remove_children()
             tmpl = self._current_template
-            preview_view.mount(Static(
-                f"[bold #9ece6a]✓ Blueprint generated:[/] "
-                f"[#7dcfff]{tmpl.name}[/]  [#565f89]· {len(content.split(chr(10)))} lines[/]\n"
-            ))
 
-            # Preview with syntax highlighting style
-            lines = content.split("\n")
-            preview_chunks = []
-            chunk = []
-            for line in lines:
-                chunk.append(line)
-                if len(chunk) >= 30:
-                    preview_chunks.append("\n".join(chunk))
-                    chunk = []
-            if chunk:
-                preview_chunks.append("\n".join(chunk))
-
-            scroll = ScrollableContainer()
-            for chunk_text in preview_chunks:
-                # Color YAML frontmatter
-                colored = self._colorize_md(chunk_text)
-                scroll.mount(Static(colored))
-
-            preview_view.mount(scroll)
-            preview_view.mount(Horizontal(
-                Button("💾  Save Blueprint", id="btn-save-blueprint", classes="btn-success"),
-                Button("📋  Copy", id="btn-copy-preview", classes="btn-ghost"),
-            ))
+            # RichLog only renders the rows in view, however long the blueprint is
+            preview_log = RichLog(markup=True, wrap=True, id="blueprint-preview-log")
+
+            # Build the whole result up front and mount it in one pass
+            await preview_view.mount_all([
+                Static(
+                    f"[bold #9ece6a]✓ Blueprint generated:[/] "
+                    f"[#7dcfff]{tmpl.name}[/]  [#565f89]· {content.count(chr(10)) + 1} lines[/]\n"
+                ),
+                preview_log,
+                Horizontal(
+                    Button("💾  Save Blueprint", id="btn-save-blueprint", classes="btn-success"),
+                    Button("📋  Copy", id="btn-copy-preview", classes="btn-ghost"),
+                ),
+            ])
+            preview_log.write(self._colorize_md(content))
 
             self.query_one("#bp-tabs", TabbedContent).active = "tab-preview"
             self.app.notify("✓ Blueprint ready", severity="information")
@@ -0,0 +1,36 @@
+"""
+NEBULA-FORGE — Guarded Writes
+Run provisioner writes to completion even when their worker is cancelled.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable
+
+from ..provisioner import Provisioner
+
+
+def write_in_flight(provisioner: Provisioner, key: str) -> bool:
+    """True while a guarded write under `key` is still running."""
+    return key in provisioner.writes_in_flight
+
+
+def start_guarded_write(
+    provisioner: Provisioner, key: str, fn: Callable[..., Any], *args: Any
+) -> asyncio.Future:
+    """Run fn(*args) in a thread and return a shielded future for its result.
+
+    Cancelling a worker can't stop the thread, so `key` stays marked on the
+    provisioner — which outlives the screen — until fn itself returns.
+    """
+    busy = provisioner.writes_in_flight
+    busy.add(key)
+
+    async def write() -> Any:
+        try:
+            return await asyncio.to_thread(fn, *args)
+        finally:
+            busy.discard(key)
+
+    return asyncio.shield(asyncio.ensure_future(write()))
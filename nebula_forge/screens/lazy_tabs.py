@@ -0,0 +1,41 @@
+"""
+NEBULA-FORGE — Lazy Tabs
+Build TabPane bodies the first time each pane is shown.
+"""
+
+from __future__ import annotations
+
+from textual.widgets import TabbedContent
+
+
+class LazyTabsMixin:
+    """Mixin for screens whose deferred TabPanes are composed empty.
+
+    DEFERRED_TABS maps a pane id to the name of the method that builds its
+    body. The body is mounted on the pane's first activation; activations
+    after that go to _on_tab_reshown instead.
+    """
+
+    DEFERRED_TABS: dict[str, str] = {}
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._built_tabs: set[str] = set()
+
+    async def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        pane_id = event.pane.id or ""
+        builder = self.DEFERRED_TABS.get(pane_id)
+        if builder is None:
+            return
+        if pane_id in self._built_tabs:
+            self._on_tab_reshown(pane_id)
+            return
+        self._built_tabs.add(pane_id)
+        await event.pane.mount(getattr(self, builder)())
+        self._on_tab_built(pane_id)
+
+    def _on_tab_built(self, pane_id: str) -> None:
+        """Called once a deferred pane's body has been mounted."""
+
+    def _on_tab_reshown(self, pane_id: str) -> None:
+        """Called when an already built deferred pane is shown again."""
@@ -5,44 +5,112 @@ Detect project, inject skills, bootstrap agent config.
 
 from __future__ import annotations
 import os
+import time
+from itertools import islice
 from pathlib import Path
+from typing import Callable
 
 from textual.app import ComposeResult
 from textual.widgets import (
     Button, Input, Label, Static, TabbedContent, TabPane,
-    Checkbox, ProgressBar, Switch
+    Checkbox, ProgressBar, Switch, RichLog
 )
 from textual.containers import (
     Vertical, Horizontal, Container, ScrollableContainer
 )
 from textual.reactive import reactive
 from textual import work
+from textual.timer import Timer
 import asyncio
 
 from ..vault import Vault
-from ..provisioner import Provisioner
-from ..models import ProjectContext, OPENCODE_PLUGINS
-
-
-class ProjectScreen(Container):
+from ..provisioner import Provisioner, split_entry_path
+from ..models import ProjectContext, ProvisionPlan, PLUGINS_BY_CATEGORY, PLUGINS_BY_NAME
+from .guarded_write import start_guarded_write, write_in_flight
+from .lazy_tabs import LazyTabsMixin
+
+LOG_MAX_LINES = 500
+# provisioner.writes_in_flight key held while a bootstrap is writing
+BOOTSTRAP_WRITE = "bootstrap"
+PROGRESS_FPS = 30
+
+# Re-scans reuse the last ProjectContext unless one of these changed (mtime).
+# "" is the project root itself: its mtime moves whenever an entry is added/removed.
+SCAN_KEY_PATHS = ("", "package.json", "pyproject.toml", ".nebula")
+SCAN_CACHE_SIZE = 8
+SKILLS_PAGE_SIZE = 50
+PATH_SETTLE_DELAY = 0.2
+
+# Ghost Diff styling per plan action: (icon, color, tag). "create" swaps in 📄 for files.
+ACTION_STYLES: dict[str, tuple[str, str, str]] = {
+    "create":  ("📁", "#9ece6a", "CREATE"),
+    "symlink": ("🔗", "#bb9af7", "INJECT"),
+    "modify":  ("✏", "#e0af68", "MODIFY"),
+}
+
+PLUGIN_CATEGORY_LABELS: dict[str, str] = {
+    "workflow": "⚡ Workflow",
+    "mcp":      "🔌 MCP",
+    "auth":     "🔑 Auth",
+    "memory":   "🧠 Memory",
+    "ui":       "💻 UI",
+    "notify":   "🔔 Notify",
+    "general":  "◈ General",
+}
+PLUGIN_CATEGORY_HEADERS: dict[str, str] = {
+    cat: f"[bold #bb9af7]{label}[/]" for cat, label in PLUGIN_CATEGORY_LABELS.items()
+}
+
+# Widget ids for plugin cards; scoped package names need '@' and '/' stripped
+PLUGIN_CARD_IDS: dict[str, str] = {
+    name: f"plugin-card-{name.replace('@', '').replace('/', '_')}" for name in PLUGINS_BY_NAME
+}
+
+# Plugin row status keyed by (installed in project, installed globally)
+PLUGIN_STATUS_MARKUP: dict[tuple[bool, bool], str] = {
+    (True, True):   "[#9ece6a]✓ project[/] [#7aa2f7]+global[/]",
+    (True, False):  "[#9ece6a]✓ project[/]",
+    (False, True):  "[#7aa2f7]✓ global[/]",
+    (False, False): "[#565f89]not installed[/]",
+}
+
+
+class ProjectScreen(LazyTabsMixin, Container):
     """Project-Specific Provisioner — one-click agent bootstrap."""
 
+    # Tabs whose bodies (and the disk reads behind them) wait until first shown
+    DEFERRED_TABS: dict[str, str] = {
+        "tab-inject":  "_build_inject",
+        "tab-plugins": "_build_plugins_tab",
+    }
+
     def __init__(self, vault: Vault, provisioner: Provisioner) -> None:
         super().__init__()
         self.vault = vault
         self.provisioner = provisioner
         self._ctx: ProjectContext | None = None
         self._selected_skills: list[str] = []
+        self._cwd: Path = Path(os.getcwd())
+        # Resolved #project-path value, kept in sync by on_input_changed
+        self._project_path: Path = self._cwd
+        self._path_settle_timer: Timer | None = None
+        self._installed: dict[str, set[str]] = {"project": set(), "global": set()}
+        self._plugin_rows: dict[str, tuple[Static, Button, Button]] = {}
+        self._skill_checkboxes: dict[str, Checkbox] = {}
+        self._plugin_counts: Static | None = None
+        self._plan_cache: tuple[tuple[int, tuple[str, ...]], ProvisionPlan] | None = None
+        self._detect_rows: dict[str, Static] = {}
+        self._scan_cache: dict[tuple, ProjectContext] = {}
+        self._detect_text: dict[str, str] = {}
 
     def compose(self) -> ComposeResult:
         yield Static("  ◈  PROJECT PROVISIONER", classes="section-title")
         with TabbedContent(id="project-tabs"):
             with TabPane("  Detect  ", id="tab-detect"):
                 yield self._build_detect()
-            with TabPane("  Inject Skills  ", id="tab-inject"):
-                yield self._build_inject()
-            with TabPane("  Plugins  ", id="tab-plugins"):
-                yield self._build_plugins_tab()
+            # Built on first reveal — see DEFERRED_TABS
+            yield TabPane("  Inject Skills  ", id="tab-inject")
+            yield TabPane("  Plugins  ", id="tab-plugins")
             with TabPane("  Ghost Diff  ", id="tab-diff"):
                 yield Container(
                     Static("[#565f89]Run detection first, then click 'Preview Plan'[/]"),
@@ -54,10 +122,29 @@ class ProjectScreen(Container):
                     id="execute-view",
                 )
 
+    def on_mount(self) -> None:
+        # These widgets live for the whole screen — resolve them once
+        self._input_path = self.query_one("#project-path", Input)
+        self._tabs = self.query_one("#project-tabs", TabbedContent)
+        self._detect_results = self.query_one("#detect-results")
+        self._diff_view = self.query_one("#diff-view")
+        self._exec_view = self.query_one("#execute-view")
+
+    def _on_tab_built(self, pane_id: str) -> None:
+        if pane_id == "tab-inject":
+            self.run_paginate_skills()
+
+    def _on_tab_reshown(self, pane_id: str) -> None:
+        # opencode.json may have changed behind the tab (bootstrap, CLI)
+        if pane_id == "tab-plugins":
+            self._sync_installed()
+
     # ── Detect Tab ────────────────────────────────────────────
 
     def _build_detect(self) -> ScrollableContainer:
-        cwd = Path(os.getcwd())
+        cwd = self._cwd
+        self._scan_status = Static("")
+        self._scan_status.display = False
         return ScrollableContainer(
             Static("[bold #7dcfff]Project Detection[/]"),
             Static("[#565f89]NEBULA-FORGE scans your current directory for project signals.[/]\n"),
@@ -67,11 +154,13 @@ class ProjectScreen(Container):
                 Button("🔍  Scan Project", id="btn-scan", classes="btn-primary"),
                 Button("📁  Use CWD", id="btn-use-cwd", classes="btn-ghost"),
             ),
+            self._scan_status,
             Container(id="detect-results"),
             classes="panel",
         )
 
-    def _build_detect_results(self, ctx: ProjectContext) -> Container:
+    def _detect_texts(self, ctx: ProjectContext) -> dict[str, str]:
+        """Markup for each detection row, keyed so re-scans can diff row by row."""
         stack_str = ", ".join(ctx.detected_stack) if ctx.detected_stack else "Unknown"
 
         status_items = [
@@ -87,16 +176,30 @@ class ProjectScreen(Container):
             note = "" if present else "[#565f89](will be created)[/]"
             lines += f"  {icon}  [#c0caf5]{label:20}[/] {note}\n"
 
-        return Container(
-            Static(f"\n[bold #7dcfff]Project: {ctx.name}[/]  [#565f89]{ctx.path}[/]"),
-            Static(f"[#bb9af7]Stack:[/]  [#9ece6a]{stack_str}[/]"),
-            Static(lines),
-            Static(f"\n[#565f89]{len(ctx.available_skills)} global skills available for injection[/]"),
-            Horizontal(
-                Button("◈  Preview Provision Plan", id="btn-preview-plan", classes="btn-primary"),
-                Button("⇢  Go to Inject Skills", id="btn-goto-inject", classes="btn-ghost"),
-            ),
-        )
+        return {
+            "project":   f"\n[bold #7dcfff]Project: {ctx.name}[/]  [#565f89]{ctx.path}[/]",
+            "stack":     f"[#bb9af7]Stack:[/]  [#9ece6a]{stack_str}[/]",
+            "checklist": lines,
+            "skills":    f"\n[#565f89]{len(ctx.available_skills)} global skills available for injection[/]",
+        }
+
+    async def _render_detect_results(self, ctx: ProjectContext) -> None:
+        """Mount the result rows on the first scan; afterwards only update rows that changed."""
+        texts = self._detect_texts(ctx)
+        if not self._detect_rows:
+            self._detect_rows = {key: Static(text) for key, text in texts.items()}
+            await self._detect_results.mount(Container(
+                *self._detect_rows.values(),
+                Horizontal(
+                    Button("◈  Preview Provision Plan", id="btn-preview-plan", classes="btn-primary"),
+                    Button("⇢  Go to Inject Skills", id="btn-goto-inject", classes="btn-ghost"),
+                ),
+            ))
+        else:
+            for key, text in texts.items():
+                if self._detect_text.get(key) != text:
+                    self._detect_rows[key].update(text)
+        self._detect_text = texts
 
     # ── Inject Skills Tab ─────────────────────────────────────
 
@@ -106,38 +209,45 @@ class ProjectScreen(Container):
             Static("[bold #7dcfff]Select Skills to Inject[/]"),
             Static("[#565f89]Selected skills will be copied into the project skills dir.[/]\n"),
         ]
+        self._skill_checkboxes = {}
+        self._pending_skills = iter(())
+        self._skills_anchor = None
         if not skills:
             skill_widgets.append(Static("[#565f89]No global skills found. Create skills in the Skill Factory first.[/]"))
         else:
-            for skill_path in sorted(skills):
-                skill_widgets.append(Checkbox(f"  {skill_path.name}", id=f"inject-{skill_path.name}"))
-            skill_widgets.append(Static(""))
+            # First page renders with the tab; the rest is appended by run_paginate_skills
+            ordered = iter(sorted(skills))
+            skill_widgets.extend(self._skill_checkbox(p) for p in islice(ordered, SKILLS_PAGE_SIZE))
+            self._pending_skills = ordered
+            self._skills_anchor = Static("")
+            skill_widgets.append(self._skills_anchor)
             skill_widgets.append(Button("✓  Confirm Selection", id="btn-confirm-skills", classes="btn-success"))
-        return ScrollableContainer(*skill_widgets, classes="panel")
+        self._inject_panel = ScrollableContainer(*skill_widgets, classes="panel")
+        return self._inject_panel
+
+    def _skill_checkbox(self, skill_path: Path) -> Checkbox:
+        cb = Checkbox(f"  {skill_path.name}", id=f"inject-{skill_path.name}")
+        self._skill_checkboxes[skill_path.name] = cb
+        return cb
+
+    @work(exclusive=True, group="skills")
+    async def run_paginate_skills(self) -> None:
+        """Mount the remaining skill checkboxes one page at a time."""
+        while self._skills_anchor is not None:
+            batch = [self._skill_checkbox(p) for p in islice(self._pending_skills, SKILLS_PAGE_SIZE)]
+            if not batch:
+                break
+            await self._inject_panel.mount_all(batch, before=self._skills_anchor)
+            await asyncio.sleep(0)
 
     # ── Plugins Tab ────────────────────────────────────────────────
 
     def _build_plugins_tab(self) -> ScrollableContainer:
-        try:
-            path_str = self.query_one("#project-path", Input).value.strip()
-            cwd = Path(path_str).expanduser() if path_str else Path(os.getcwd())
-        except Exception:
-            cwd = Path(os.getcwd())
-        installed = self.provisioner.get_installed_plugins(cwd, scope="project")
-        installed_global = self.provisioner.get_installed_plugins(cwd, scope="global")
-
-        CATEGORY_LABELS = {
-            "workflow": "⚡ Workflow",
-            "mcp":      "🔌 MCP",
-            "auth":     "🔑 Auth",
-            "memory":   "🧠 Memory",
-            "ui":       "💻 UI",
-            "notify":   "🔔 Notify",
-            "general":  "◈ General",
-        }
-
-        proj_installed = len(installed)
-        glob_installed = len(installed_global)
+        self._installed = self._read_installed()
+        installed = self._installed["project"]
+        installed_global = self._installed["global"]
+        self._plugin_rows = {}
+        self._plugin_counts = Static(self._plugin_counts_markup())
 
         widgets: list = [
             Static("[bold #7dcfff]OpenCode Plugin Catalogue[/]"),
@@ -145,221 +255,317 @@ class ProjectScreen(Container):
                 "[#565f89]Plugins are added as MCP entries into [#9ece6a]opencode.json[/] — no code required.\n"
                 f"[#bb9af7]+P[/] [#565f89]= install into project  [/][#7aa2f7]+G[/] [#565f89]= install globally[/]\n"
             ),
-            Static(
-                f"[#565f89]Project:[/]  [#c0caf5]{cwd}[/]  "
-                f"[#9ece6a]{proj_installed} proj[/]  [#7aa2f7]{glob_installed} global[/]"
-            ),
+            self._plugin_counts,
             Static(""),
         ]
 
-        # Group plugins by category
-        by_cat: dict[str, list] = {}
-        for p in OPENCODE_PLUGINS:
-            by_cat.setdefault(p.category, []).append(p)
-
-        for cat, plugins in by_cat.items():
-            widgets.append(Static(f"[bold #bb9af7]{CATEGORY_LABELS.get(cat, cat)}[/]"))
+        for cat, plugins in PLUGINS_BY_CATEGORY.items():
+            widgets.append(Static(PLUGIN_CATEGORY_HEADERS.get(cat) or f"[bold #bb9af7]{cat}[/]"))
             for plugin in plugins:
                 in_proj   = plugin.name in installed
                 in_global = plugin.name in installed_global
-                status = "[#9ece6a]✓ project[/]" if in_proj else (
-                    "[#7aa2f7]✓ global[/]" if in_global else "[#565f89]not installed[/]"
+                name_static = Static(
+                    f"[bold #c0caf5]{plugin.display}[/]  {PLUGIN_STATUS_MARKUP[in_proj, in_global]}",
+                    classes="plugin-name",
+                )
+                # Both ✕ buttons always exist; installs/removals just flip their display
+                rm_proj = Button("✕P", id=f"plug-rm-proj-{plugin.name}", classes="btn-danger")
+                rm_glob = Button("✕G", id=f"plug-rm-glob-{plugin.name}", classes="btn-danger")
+                rm_proj.display = in_proj
+                rm_glob.display = in_global
+                row = Horizontal(
+                    name_static,
+                    Button("+P", id=f"plug-proj-{plugin.name}", classes="btn-ghost"),
+                    Button("+G", id=f"plug-glob-{plugin.name}", classes="btn-ghost"),
+                    rm_proj,
+                    rm_glob,
                 )
+                self._plugin_rows[plugin.name] = (name_static, rm_proj, rm_glob)
                 widgets.append(Container(
-                    Horizontal(
-                        Static(f"[bold #c0caf5]{plugin.display}[/]  {status}", classes="plugin-name"),
-                        Button("+P", id=f"plug-proj-{plugin.name}", classes="btn-ghost"),
-                        Button("+G", id=f"plug-glob-{plugin.name}", classes="btn-ghost"),
-                        Button("✕P", id=f"plug-rm-proj-{plugin.name}", classes="btn-danger") if in_proj else Static(""),
-                        Button("✕G", id=f"plug-rm-glob-{plugin.name}", classes="btn-danger") if in_global else Static(""),
-                    ),
+                    row,
                     Static(f"[#565f89]{plugin.description}[/]"),
                     Static(f"[#3b4261]{plugin.npm_install}[/]"),
                     classes="plugin-card",
-                    id=f"plugin-card-{plugin.name.replace('@','').replace('/','_')}",
+                    id=PLUGIN_CARD_IDS[plugin.name],
                 ))
 
         return ScrollableContainer(*widgets, id="plugins-panel", classes="panel")
 
+    def _plugin_counts_markup(self) -> str:
+        return (
+            f"[#565f89]Project:[/]  [#c0caf5]{self._project_path}[/]  "
+            f"[#9ece6a]{len(self._installed['project'])} proj[/]  "
+            f"[#7aa2f7]{len(self._installed['global'])} global[/]"
+        )
+
+    def _read_installed(self) -> dict[str, set[str]]:
+        """Installed plugin names per scope for the current project path."""
+        cwd = self._project_path
+        return {
+            scope: set(self.provisioner.get_installed_plugins(cwd, scope=scope))
+            for scope in ("project", "global")
+        }
+
+    def _update_plugin_row(self, plugin_name: str) -> None:
+        """Patch a single plugin row in place after an install/remove."""
+        plugin = PLUGINS_BY_NAME.get(plugin_name)
+        entry = self._plugin_rows.get(plugin_name)
+        if plugin is None or entry is None:
+            return
+        name_static, rm_proj, rm_glob = entry
+        in_proj = plugin_name in self._installed["project"]
+        in_global = plugin_name in self._installed["global"]
+        name_static.update(f"[bold #c0caf5]{plugin.display}[/]  {PLUGIN_STATUS_MARKUP[in_proj, in_global]}")
+        rm_proj.display = in_proj
+        rm_glob.display = in_global
+        if self._plugin_counts is not None:
+            self._plugin_counts.update(self._plugin_counts_markup())
+
     # ── Events ────────────────────────────────────────────────
 
+    _PLUGIN_SCOPES: dict[str, str] = {"proj": "project", "glob": "global"}
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         bid = event.button.id or ""
 
-        if bid == "btn-scan":
-            self._scan_project()
-        elif bid == "btn-use-cwd":
-            try:
-                self.query_one("#project-path", Input).value = str(Path(os.getcwd()))
-            except Exception:
-                pass
-        elif bid == "btn-preview-plan":
-            self._preview_plan()
-        elif bid == "btn-goto-inject":
-            try:
-                self.query_one("#project-tabs", TabbedContent).active = "tab-inject"
-            except Exception:
-                pass
-        elif bid == "btn-confirm-skills":
-            self._collect_skills()
-        elif bid == "btn-bootstrap":
-            self._execute_bootstrap()
-        elif bid == "btn-goto-execute":
-            try:
-                self.query_one("#project-tabs", TabbedContent).active = "tab-execute"
-            except Exception:
-                pass
-        elif bid.startswith("plug-proj-"):
-            self._install_plugin(bid[len("plug-proj-"):], scope="project")
-        elif bid.startswith("plug-glob-"):
-            self._install_plugin(bid[len("plug-glob-"):], scope="global")
-        elif bid.startswith("plug-rm-proj-"):
-            self._remove_plugin(bid[len("plug-rm-proj-"):], scope="project")
-        elif bid.startswith("plug-rm-glob-"):
-            self._remove_plugin(bid[len("plug-rm-glob-"):], scope="global")
+        handler = self._HANDLERS.get(bid)
+        if handler is not None:
+            handler(self)
+            return
+
+        # Plugin ids: plug-{proj|glob}-<name> / plug-rm-{proj|glob}-<name>
+        if not bid.startswith("plug-"):
+            return
+        rest = bid[5:]
+        removing = rest.startswith("rm-")
+        if removing:
+            rest = rest[3:]
+        tag, _, plugin_name = rest.partition("-")
+        scope = self._PLUGIN_SCOPES.get(tag)
+        if scope is None or not plugin_name:
+            return
+        if removing:
+            self._remove_plugin(plugin_name, scope=scope)
+        else:
+            self._install_plugin(plugin_name, scope=scope)
+
+    def _use_cwd(self) -> None:
+        self._input_path.value = str(self._cwd)
+
+    def _goto_inject(self) -> None:
+        self._tabs.active = "tab-inject"
+
+    def _goto_execute(self) -> None:
+        self._tabs.active = "tab-execute"
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id == "project-path":
+            path_str = event.value.strip()
+            self._project_path = Path(path_str).expanduser() if path_str else self._cwd
+            # Coalesce keystrokes: only the settled path touches the filesystem
+            if self._path_settle_timer is not None:
+                self._path_settle_timer.stop()
+            self._path_settle_timer = self.set_timer(PATH_SETTLE_DELAY, self._on_path_settled)
+
+    def _on_path_settled(self) -> None:
+        """Re-read plugin install state for the newly typed project path."""
+        self._path_settle_timer = None
+        if "tab-plugins" not in self._built_tabs:
+            return  # the catalogue reads the settled path when first opened
+        self._sync_installed()
+
+    def _sync_installed(self) -> None:
+        """Re-read install state and patch only the plugin rows that changed."""
+        fresh = self._read_installed()
+        changed = (fresh["project"] ^ self._installed["project"]) | (fresh["global"] ^ self._installed["global"])
+        self._installed = fresh
+        for plugin_name in changed & PLUGINS_BY_NAME.keys():
+            self._update_plugin_row(plugin_name)
+        if self._plugin_counts is not None:
+            self._plugin_counts.update(self._plugin_counts_markup())
 
     def _install_plugin(self, plugin_name: str, scope: str) -> None:
-        plugin = next((p for p in OPENCODE_PLUGINS if p.name == plugin_name), None)
+        plugin = PLUGINS_BY_NAME.get(plugin_name)
         if not plugin:
             self.app.notify(f"Plugin not found: {plugin_name}", severity="error")
             return
-        try:
-            path_str = self.query_one("#project-path", Input).value.strip()
-        except Exception:
-            path_str = str(Path(os.getcwd()))
-        cwd = Path(path_str).expanduser()
+        cwd = self._project_path
         ok, msg = self.provisioner.install_plugin_to_project(
             cwd, plugin_name, plugin.config_snippet, scope=scope
         )
         self.app.notify(msg, severity="information" if ok else "error")
-        self._refresh_plugins_tab()
+        if ok:
+            self._installed[scope].add(plugin_name)
+            self._update_plugin_row(plugin_name)
 
     def _remove_plugin(self, plugin_name: str, scope: str) -> None:
-        try:
-            path_str = self.query_one("#project-path", Input).value.strip()
-        except Exception:
-            path_str = str(Path(os.getcwd()))
-        cwd = Path(path_str).expanduser()
+        cwd = self._project_path
         ok, msg = self.provisioner.remove_plugin_from_project(cwd, plugin_name, scope=scope)
         self.app.notify(msg, severity="information" if ok else "error")
-        self._refresh_plugins_tab()
-
-    def _refresh_plugins_tab(self) -> None:
-        try:
-            panel = self.query_one("#plugins-panel")
-            panel.remove()
-        except Exception:
-            pass
-        try:
-            tab = self.query_one("#tab-plugins")
-            tab.mount(self._build_plugins_tab())
-        except Exception:
-            pass
+        if ok:
+            self._installed[scope].discard(plugin_name)
+            self._update_plugin_row(plugin_name)
 
     def _scan_project(self) -> None:
-        try:
-            path_str = self.query_one("#project-path", Input).value.strip()
-        except Exception:
-            path_str = str(Path(os.getcwd()))
-
-        path = Path(path_str).expanduser()
+        path = self._project_path
         if not path.exists():
             self.app.notify(f"Path not found: {path}", severity="error")
             return
 
-        self._ctx = self.provisioner.detect_project(path)
-        results = self.query_one("#detect-results")
-        results.remove_children()
-        results.mount(self._build_detect_results(self._ctx))
-        self.app.notify(f"✓ Scanned: {self._ctx.name}", severity="information")
+        self.run_scan(path)
 
-    def _collect_skills(self) -> None:
-        self._selected_skills = []
-        for skill_path in self.vault.list_global_skills():
-            name = skill_path.name
+    @work(exclusive=True, group="scan")
+    async def run_scan(self, path: Path) -> None:
+        self._scan_status.update(f"[#7aa2f7]Scanning {path}...[/]")
+        self._scan_status.display = True
+
+        # detect_project is blocking filesystem work — keep it off the event loop
+        try:
+            ctx = await asyncio.to_thread(self._detect_cached, path)
+        except Exception as e:
+            self.app.notify(f"Scan failed: {e}", severity="error")
+            return
+        finally:
+            self._scan_status.display = False
+        self._ctx = ctx
+        self._plan_cache = None
+
+        await self._render_detect_results(ctx)
+        self.app.notify(f"✓ Scanned: {ctx.name}", severity="information")
+
+    def _scan_key(self, path: Path) -> tuple:
+        """Resolved path plus the mtimes detect_project's answer depends on."""
+        mtimes: list[int] = []
+        for p in (*(path / rel for rel in SCAN_KEY_PATHS), self.vault.skills_dir):
             try:
-                cb = self.query_one(f"#inject-{name}", Checkbox)
-                if cb.value:
-                    self._selected_skills.append(name)
-            except Exception:
-                pass
+                mtimes.append(p.stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(0)
+        return (str(path.resolve()), *mtimes)
+
+    def _detect_cached(self, path: Path) -> ProjectContext:
+        """detect_project, skipped when nothing it looks at has changed on disk."""
+        key = self._scan_key(path)
+        ctx = self._scan_cache.get(key)
+        if ctx is None:
+            ctx = self.provisioner.detect_project(path)
+            if len(self._scan_cache) >= SCAN_CACHE_SIZE:
+                del self._scan_cache[next(iter(self._scan_cache))]
+            self._scan_cache[key] = ctx
+        return ctx
+
+    def _collect_skills(self) -> None:
+        self._plan_cache = None
+        self._selected_skills = [name for name, cb in self._skill_checkboxes.items() if cb.value]
         n = len(self._selected_skills)
         self.app.notify(f"✓ {n} skill{'s' if n != 1 else ''} selected for injection")
 
+    async def _get_plan(self) -> ProvisionPlan:
+        """Bootstrap plan for the current scan + skill selection, built once per change."""
+        key = (id(self._ctx), tuple(self._selected_skills))
+        if self._plan_cache is None or self._plan_cache[0] != key:
+            # Planning reads every selected SKILL.md — keep it off the event loop
+            plan = await asyncio.to_thread(
+                self.provisioner.plan_project_bootstrap, self._ctx, list(self._selected_skills)
+            )
+            self._plan_cache = (key, plan)
+        return self._plan_cache[1]
+
     def _preview_plan(self) -> None:
         if not self._ctx:
             self.app.notify("Scan a project first", severity="warning")
             return
+        self.run_preview()
 
-        plan = self.provisioner.plan_project_bootstrap(self._ctx, self._selected_skills)
-        diff_view = self.query_one("#diff-view")
-        diff_view.remove_children()
-
-        diff_view.mount(Static(f"[bold #7dcfff]Ghost Diff: {plan.title}[/]\n"))
-        diff_view.mount(Static(f"[#565f89]{plan.description}[/]\n"))
-        diff_view.mount(Static("[bold #7dcfff]Files & Directories:[/]"))
+    @work(exclusive=True, group="preview")
+    async def run_preview(self) -> None:
+        plan = await self._get_plan()
+        diff_view = self._diff_view
 
+        # One Static for all entries — a widget per entry costs a layout pass each
+        lines: list[str] = []
         for entry in plan.entries:
-            p = Path(entry.path)
-            if entry.action == "create":
-                icon = "📁" if not p.suffix else "📄"
-                color = "#9ece6a"
-                tag = "CREATE"
-            elif entry.action == "symlink":
-                icon = "🔗"
-                color = "#bb9af7"
-                tag = "INJECT"
-            else:
-                icon = "✏"
-                color = "#e0af68"
-                tag = "MODIFY"
-
-            diff_view.mount(Static(
-                f"  [{color}]{icon} [{tag}][/] [#c0caf5]{p.name}[/]  "
-                f"[#565f89]{entry.description or str(p.parent)[:50]}[/]"
-            ))
-
-        diff_view.mount(Static(f"\n[#565f89]{plan.summary()}[/]"))
-        diff_view.mount(Horizontal(
-            Button("⚡  Bootstrap Project", id="btn-bootstrap", classes="btn-success"),
-            Button("← Adjust", id="btn-goto-inject", classes="btn-ghost"),
-        ))
+            parent, name, has_suffix = split_entry_path(entry.path)
+            icon, color, tag = ACTION_STYLES.get(entry.action, ACTION_STYLES["modify"])
+            if entry.action == "create" and has_suffix:
+                icon = "📄"
+
+            lines.append(
+                f"  [{color}]{icon} [{tag}][/] [#c0caf5]{name}[/]  "
+                f"[#565f89]{entry.description or parent[:50]}[/]"
+            )
+
+        # Swap the whole view in one remove + one mount
+        await diff_view.remove_children()
+        await diff_view.mount_all([
+            Static(f"[bold #7dcfff]Ghost Diff: {plan.title}[/]\n"),
+            Static(f"[#565f89]{plan.description}[/]\n"),
+            Static("[bold #7dcfff]Files & Directories:[/]"),
+            Static("\n".join(lines)),
+            Static(f"\n[#565f89]{plan.summary()}[/]"),
+            Horizontal(
+                Button("⚡  Bootstrap Project", id="btn-bootstrap", classes="btn-success"),
+                Button("← Adjust", id="btn-goto-inject", classes="btn-ghost"),
+            ),
+        ])
 
-        try:
-            self.query_one("#project-tabs", TabbedContent).active = "tab-diff"
-        except Exception:
-            pass
+        self._tabs.active = "tab-diff"
 
     def _execute_bootstrap(self) -> None:
         if not self._ctx:
             self.app.notify("No project context. Scan first.", severity="error")
             return
-        plan = self.provisioner.plan_project_bootstrap(self._ctx, self._selected_skills)
-        self.run_bootstrap(plan)
+        if write_in_flight(self.provisioner, BOOTSTRAP_WRITE):
+            self.app.notify("Bootstrap already running", severity="warning")
+            return
+        self.run_bootstrap()
 
     @work(exclusive=True)
-    async def run_bootstrap(self, plan) -> None:
-        try:
-            self.query_one("#project-tabs", TabbedContent).active = "tab-execute"
-        except Exception:
-            pass
+    async def run_bootstrap(self) -> None:
+        self._tabs.active = "tab-execute"
+        plan = await self._get_plan()
 
-        exec_view = self.query_one("#execute-view")
-        exec_view.remove_children()
-        exec_view.mount(Static(f"[bold #7dcfff]Bootstrapping: {plan.title}[/]\n"))
+        exec_view = self._exec_view
         pb = ProgressBar(total=100, show_eta=False)
-        exec_view.mount(pb)
         status = Static("[#565f89]Starting...[/]")
-        exec_view.mount(status)
-        log_area = ScrollableContainer()
-        exec_view.mount(log_area)
+        log = RichLog(max_lines=LOG_MAX_LINES, markup=True, id="bootstrap-log")
+        await exec_view.remove_children()
+        await exec_view.mount_all([
+            Static(f"[bold #7dcfff]Bootstrapping: {plan.title}[/]\n"),
+            pb,
+            status,
+            log,
+        ])
+
+        # execute_plan runs in a thread; progress crosses back through a queue
+        # so widgets are only ever touched from the event loop
+        loop = asyncio.get_running_loop()
+        progress: asyncio.Queue[tuple[str, float] | None] = asyncio.Queue()
 
         def on_progress(msg: str, pct: float) -> None:
-            pb.progress = int(pct * 100)
-            status.update(f"[#7aa2f7]{msg}[/]")
-            log_area.mount(Static(f"  [#9ece6a]✓[/] [#565f89]{msg}[/]"))
+            loop.call_soon_threadsafe(progress.put_nowait, (msg, pct))
 
-        ok, msg = self.provisioner.execute_plan(plan, on_progress)
+        write = start_guarded_write(
+            self.provisioner, BOOTSTRAP_WRITE, self.provisioner.execute_plan, plan, on_progress
+        )
+        write.add_done_callback(lambda _: progress.put_nowait(None))
+        pending: list[str] = []
+        last_paint = 0.0
+        while (event := await progress.get()) is not None:
+            step, pct = event
+            pending.append(f"  [#9ece6a]✓[/] [#565f89]{step}[/]")
+            # Repaint at most PROGRESS_FPS times a second; steps in between only queue log lines
+            now = time.monotonic()
+            if now - last_paint >= 1 / PROGRESS_FPS:
+                last_paint = now
+                pb.progress = int(pct * 100)
+                status.update(f"[#7aa2f7]{step}[/]")
+                log.write("\n".join(pending))
+                pending.clear()
+        if pending:
+            log.write("\n".join(pending))
+
+        ok, msg = await write
         await asyncio.sleep(0.2)
 
         if ok:
@@ -373,3 +579,14 @@ class ProjectScreen(Container):
         else:
             status.update(f"[#f7768e]✗ Bootstrap failed: {msg}[/]")
             self.app.notify("Bootstrap failed", severity="error")
+
+    # Button id → handler; built after the methods so a bad name fails at import
+    _HANDLERS: dict[str, Callable[[ProjectScreen], None]] = {
+        "btn-scan": _scan_project,
+        "btn-use-cwd": _use_cwd,
+        "btn-preview-plan": _preview_plan,
+        "btn-goto-inject": _goto_inject,
+        "btn-confirm-skills": _collect_skills,
+        "btn-bootstrap": _execute_bootstrap,
+        "btn-goto-execute": _goto_execute,
+    }
@@ -5,8 +5,12 @@ Browse, create, and manage global skills.
 
 from __future__ import annotations
 import os
+import re
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 
 from textual.app import ComposeResult
 from textual.widgets import (
@@ -21,10 +25,12 @@ from textual import work
 import asyncio
 
 from ..vault import Vault
-from ..provisioner import Provisioner
+from ..provisioner import Provisioner, split_entry_path
 from ..models import SkillMetadata
+from .guarded_write import start_guarded_write, write_in_flight
+from .lazy_tabs import LazyTabsMixin
 
-CATEGORIES = [
+CATEGORIES = (
     ("Code Generation", "code-gen"),
     ("Code Review", "code-review"),
     ("Testing", "testing"),
@@ -35,21 +41,75 @@ CATEGORIES = [
     ("Performance", "performance"),
     ("Data", "data"),
     ("General", "general"),
-]
+)
 
-MODELS = [
+MODELS = (
     ("copilot/claude-opus-4-6", "copilot/claude-opus-4-6"),
     ("copilot/gpt-5.1-codex-max", "copilot/gpt-5.1-codex-max"),
     ("copilot/gemini-3.1-pro-preview", "copilot/gemini-3.1-pro-preview"),
     ("nvidia/devstral-2-123b-instruct-2512", "nvidia/devstral-2-123b-instruct-2512"),
     ("opencodezen/minimax-m2-5", "opencodezen/minimax-m2-5"),
     ("copilot/claude-sonnet-4-5", "copilot/claude-sonnet-4-5"),
-]
+)
+
+# (category, model, description) shown when SKILL.md is missing or unreadable
+SKILL_META_DEFAULTS = ("general", "—", "No description")
+
+# provisioner.writes_in_flight key held while a new skill is being written
+PROVISION_WRITE = "skill"
+
+# Registry cards mounted up front, and per page as the list is scrolled
+REGISTRY_PAGE_SIZE = 40
+REGISTRY_READ_WORKERS = 8
+
+# Preview shows the head of SKILL.md only; the rest is never read
+PREVIEW_MAX_CHARS = 3000
+
+# Frontmatter sits at the top of SKILL.md; the body is never needed for a card
+FRONTMATTER_READ_SIZE = 2048
+FRONTMATTER_RE = re.compile(
+    r"^(category|model_preference|description):[ \t]*(?:>[ \t]*(?:\n[ \t]*)?)?(.*)$",
+    re.M,
+)
 
 
-class SkillFactoryScreen(Container):
+@lru_cache(maxsize=512)
+def _parse_skill_meta(skill_md: str, mtime_ns: int, size: int) -> tuple[str, str, str]:
+    """Read (category, model, description) from SKILL.md frontmatter; keyed on mtime/size."""
+    try:
+        with open(skill_md) as f:
+            head = f.read(FRONTMATTER_READ_SIZE)
+    except Exception:
+        return SKILL_META_DEFAULTS
+    end = head.find("\n---", 3) if head.startswith("---") else -1
+    if end != -1:
+        head = head[:end]
+    fields = {key: value.strip() for key, value in FRONTMATTER_RE.findall(head)}
+    category, model, desc = SKILL_META_DEFAULTS
+    return (
+        fields.get("category", category),
+        fields.get("model_preference", model),
+        fields.get("description", desc),
+    )
+
+
+def _skill_row(entry: os.DirEntry) -> tuple[str, str, str, str]:
+    skill_md = os.path.join(entry.path, "SKILL.md")
+    try:
+        st = os.stat(skill_md)
+    except OSError:
+        return (entry.name, *SKILL_META_DEFAULTS)
+    return (entry.name, *_parse_skill_meta(skill_md, st.st_mtime_ns, st.st_size))
+
+
+class SkillFactoryScreen(LazyTabsMixin, Container):
     """Global Skill Factory — Registry, creation, copy to project."""
 
+    DEFERRED_TABS: dict[str, str] = {
+        "tab-create":  "_build_create_form",
+        "tab-preview": "_build_preview_tab",
+    }
+
     view: reactive[str] = reactive("registry")
 
     def __init__(self, vault: Vault, provisioner: Provisioner) -> None:
@@ -58,68 +118,85 @@ class SkillFactoryScreen(Container):
         self.provisioner = provisioner
         self._selected_skill: str | None = None
         self._skill_scope: str = "global"  # "global" | "local"
+        self._cwd: Path = Path(os.getcwd())
+        self._registry_panel: ScrollableContainer | None = None
+        self._registry_count: Static | None = None
+        self._registry_total = 0
+        self._pending_cards = None
+        self._preview_title: Static | None = None
 
     def compose(self) -> ComposeResult:
         yield Static("  ◈  GLOBAL SKILL FACTORY", classes="section-title")
         with TabbedContent(id="skill-tabs"):
             with TabPane("  Registry  ", id="tab-registry"):
                 yield self._build_registry()
-            with TabPane("  Create Skill  ", id="tab-create"):
-                yield self._build_create_form()
-            with TabPane("  Preview  ", id="tab-preview"):
-                yield self._build_preview_tab()
+            # Built on first reveal — see DEFERRED_TABS
+            yield TabPane("  Create Skill  ", id="tab-create")
+            yield TabPane("  Preview  ", id="tab-preview")
 
     # ── Registry ──────────────────────────────────────────────
 
     def _build_registry(self) -> ScrollableContainer:
-        skills = self.vault.list_global_skills()
-
-        header = Horizontal(
-            Static(f"[bold #7dcfff]{len(skills)} skills registered[/]  "
-                   f"[#565f89]in {self.vault.skills_dir}[/]"),
-            Button("＋ Create New Skill", id="btn-goto-create", classes="btn-primary"),
-            id="registry-header",
+        self._registry_count = Static(f"[#565f89]Loading skills from {self.vault.skills_dir}...[/]")
+        self._registry_panel = ScrollableContainer(
+            Horizontal(
+                self._registry_count,
+                Button("＋ Create New Skill", id="btn-goto-create", classes="btn-primary"),
+                id="registry-header",
+            ),
+            classes="panel",
+        )
+        return self._registry_panel
+
+    def on_mount(self) -> None:
+        self.run_load_registry()
+
+    def _scan_registry(self) -> list[tuple[str, str, str, str]]:
+        """(name, category, model, description) per skill — runs off the event loop."""
+        entries = self.vault.scan_global_skills()
+        if len(entries) <= REGISTRY_READ_WORKERS:
+            return [_skill_row(e) for e in entries]
+        # SKILL.md reads are I/O bound; overlap them so slow disks cost max, not sum
+        with ThreadPoolExecutor(max_workers=REGISTRY_READ_WORKERS) as pool:
+            return list(pool.map(_skill_row, entries))
+
+    @work(exclusive=True, group="registry")
+    async def run_load_registry(self) -> None:
+        rows = await asyncio.to_thread(self._scan_registry)
+        panel = self._registry_panel
+        self._registry_total = len(rows)
+        self._set_registry_count()
+        if not rows:
+            await panel.mount(Static(
+                f"\n[#565f89]No skills yet. Click '＋ Create New Skill' to add your first skill.[/]\n\n"
+                f"[#3b4261]Skills are stored in {self.vault.skills_dir}/[skill-name]/SKILL.md\n"
+                "They can be injected into any project context.[/]"
+            ))
+            return
+        # Only the first page is built now; the rest mounts as the list scrolls
+        pending = iter(rows)
+        await panel.mount_all([self._make_skill_card(*r) for r in islice(pending, REGISTRY_PAGE_SIZE)])
+        if len(rows) > REGISTRY_PAGE_SIZE:
+            self._pending_cards = pending
+            self.watch(panel, "scroll_y", self._on_registry_scroll, init=False)
+
+    def _set_registry_count(self) -> None:
+        self._registry_count.update(
+            f"[bold #7dcfff]{self._registry_total} skills registered[/]  "
+            f"[#565f89]in {self.vault.skills_dir}[/]"
         )
 
-        if not skills:
-            return ScrollableContainer(
-                header,
-                Static(
-                    f"\n[#565f89]No skills yet. Click '＋ Create New Skill' to add your first skill.[/]\n\n"
-                    f"[#3b4261]Skills are stored in {self.vault.skills_dir}/[skill-name]/SKILL.md\n"
-                    "They can be injected into any project context.[/]"
-                ),
-                classes="panel",
-            )
-        else:
-            return ScrollableContainer(
-                header,
-                *[self._make_skill_card(p) for p in sorted(skills)],
-                classes="panel",
-            )
-
-    def _make_skill_card(self, skill_path: Path) -> Container:
-        skill_md = skill_path / "SKILL.md"
-        name = skill_path.name
-        category = "general"
-        model = "—"
-        desc = "No description"
-
-        if skill_md.exists():
-            try:
-                content = skill_md.read_text()
-                for line in content.split("\n"):
-                    if line.startswith("category:"):
-                        category = line.split(":", 1)[1].strip()
-                    elif line.startswith("model_preference:"):
-                        model = line.split(":", 1)[1].strip()
-                    elif line.startswith("description:"):
-                        desc = line.split(":", 1)[1].strip()
-                        if desc.startswith(">"):
-                            desc = desc[1:].strip()
-            except Exception:
-                pass
+    def _on_registry_scroll(self, scroll_y: float) -> None:
+        panel = self._registry_panel
+        if self._pending_cards is None or scroll_y < panel.max_scroll_y - panel.size.height:
+            return
+        batch = [self._make_skill_card(*r) for r in islice(self._pending_cards, REGISTRY_PAGE_SIZE)]
+        if len(batch) < REGISTRY_PAGE_SIZE:
+            self._pending_cards = None
+        if batch:
+            panel.mount_all(batch)
 
+    def _make_skill_card(self, name: str, category: str, model: str, desc: str) -> Container:
         return Container(
             Horizontal(
                 Static(f"[bold #7dcfff]◈  {name}[/]", classes="skill-name"),
@@ -142,6 +219,11 @@ class SkillFactoryScreen(Container):
     # ── Create Form ───────────────────────────────────────────
 
     def _build_create_form(self) -> ScrollableContainer:
+        self._scope_buttons = {
+            "global": Button("🌐  Global", id="btn-scope-global-skill", classes="btn-primary"),
+            "local": Button("📁  Local (CWD)", id="btn-scope-local-skill", classes="btn-ghost"),
+        }
+        self._scope_label = Static("", id="skill-scope-label")
         return ScrollableContainer(
             Static("[bold #7dcfff]Zero-Touch Skill Provision[/]"),
             Static("[#565f89]Fill out the form and hit Create — NEBULA-FORGE does the rest.[/]\n"),
@@ -162,12 +244,8 @@ class SkillFactoryScreen(Container):
                 "[#565f89]Global → ~/.config/opencode/skills/  (shared across all projects)\n"
                 "Local  → <cwd>/.opencode/skills/  (only for the project where you launched nf)[/]"
             ),
-            Horizontal(
-                Button("🌐  Global", id="btn-scope-global-skill", classes="btn-primary"),
-                Button("📁  Local (CWD)", id="btn-scope-local-skill", classes="btn-ghost"),
-                id="skill-scope-bar",
-            ),
-            Static("", id="skill-scope-label"),
+            Horizontal(*self._scope_buttons.values(), id="skill-scope-bar"),
+            self._scope_label,
             Static(""),
             Horizontal(
                 Button("⚡ Create Skill", id="btn-create-skill", classes="btn-primary"),
@@ -178,26 +256,37 @@ class SkillFactoryScreen(Container):
         )
 
     def _build_preview_tab(self) -> Container:
-        if self._selected_skill:
-            skill_path = self.vault.skills_dir / self._selected_skill
-            skill_md = skill_path / "SKILL.md"
-            if skill_md.exists():
-                content = skill_md.read_text()[:3000]
-                return Container(
-                    Static(f"[bold #7dcfff]Preview: {self._selected_skill}[/]\n"),
-                    Static(f"[#565f89]{skill_path}[/]\n"),
-                    Static(f"[#c0caf5]{content}[/]", classes="panel"),
-                    classes="panel",
-                )
-            return Container(
-                Static("[#f7768e]Skill file not found.[/]"),
-                classes="panel",
-            )
+        self._preview_title = Static("")
+        self._preview_path = Static("")
+        self._preview_body = Static("", classes="panel")
+        self._render_preview()
         return Container(
-            Static("[#565f89]Select a skill from the Registry tab to preview it here.[/]"),
+            self._preview_title,
+            self._preview_path,
+            self._preview_body,
             classes="panel",
         )
 
+    def _render_preview(self) -> None:
+        """Point the preview statics at the selected skill, updating them in place."""
+        title, path, body = self._preview_title, self._preview_path, self._preview_body
+        path.display = body.display = False
+        if not self._selected_skill:
+            title.update("[#565f89]Select a skill from the Registry tab to preview it here.[/]")
+            return
+        skill_path = self.vault.skills_dir / self._selected_skill
+        skill_md = skill_path / "SKILL.md"
+        try:
+            with skill_md.open(encoding="utf-8", errors="replace") as f:
+                content = f.read(PREVIEW_MAX_CHARS)
+        except OSError:
+            title.update("[#f7768e]Skill file not found.[/]")
+            return
+        title.update(f"[bold #7dcfff]Preview: {self._selected_skill}[/]\n")
+        path.update(f"[#565f89]{skill_path}[/]\n")
+        body.update(f"[#c0caf5]{content}[/]")
+        path.display = body.display = True
+
     # ── Events ────────────────────────────────────────────────
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
@@ -221,32 +310,10 @@ class SkillFactoryScreen(Container):
                     pass
 
         elif bid == "btn-scope-global-skill":
-            self._skill_scope = "global"
-            try:
-                self.query_one("#btn-scope-global-skill", Button).add_class("btn-primary")
-                self.query_one("#btn-scope-global-skill", Button).remove_class("btn-ghost")
-                self.query_one("#btn-scope-local-skill", Button).remove_class("btn-primary")
-                self.query_one("#btn-scope-local-skill", Button).add_class("btn-ghost")
-                self.query_one("#skill-scope-label", Static).update(
-                    f"[#565f89]→ {self.vault.skills_dir}[/]"
-                )
-            except Exception:
-                pass
+            self._set_skill_scope("global")
 
         elif bid == "btn-scope-local-skill":
-            self._skill_scope = "local"
-            try:
-                self.query_one("#btn-scope-local-skill", Button).add_class("btn-primary")
-                self.query_one("#btn-scope-local-skill", Button).remove_class("btn-ghost")
-                self.query_one("#btn-scope-global-skill", Button).remove_class("btn-primary")
-                self.query_one("#btn-scope-global-skill", Button).add_class("btn-ghost")
-                cwd = Path(os.getcwd())
-                subdir = self.vault.load().project_skills_subdir
-                self.query_one("#skill-scope-label", Static).update(
-                    f"[#565f89]→ {cwd / subdir}[/]"
-                )
-            except Exception:
-                pass
+            self._set_skill_scope("local")
 
         elif bid.startswith("preview-"):
             self._selected_skill = bid[8:]
@@ -298,39 +365,52 @@ class SkillFactoryScreen(Container):
         )
 
         if self._skill_scope == "local":
-            cwd = Path(os.getcwd())
-            subdir = self.vault.load().project_skills_subdir
-            target_dir: Path | None = cwd / subdir
+            target_dir: Path | None = self._local_skills_dir()
         else:
             target_dir = None  # uses vault.skills_dir (global)
+        if write_in_flight(self.provisioner, PROVISION_WRITE):
+            self.app.notify("A skill is still being provisioned", severity="warning")
+            return
         self.run_provision_skill(meta, target_dir)
 
     @work(exclusive=True)
     async def run_provision_skill(self, meta: SkillMetadata, target_dir: Path | None = None) -> None:
         area = self.query_one("#create-progress-area")
-        area.remove_children()
-        area.mount(Static(f"\n[#7dcfff]Provisioning skill: {meta.name}[/]"))
+        await area.remove_children()
         pb = ProgressBar(total=100, show_eta=False)
-        area.mount(pb)
         status = Static("[#565f89]Starting...[/]")
-        area.mount(status)
 
         plan = self.provisioner.plan_skill_creation(meta, target_dir=target_dir)
 
-        # Show ghost diff
-        area.mount(Static("\n[bold #7dcfff]Ghost Preview — Files to Create:[/]"))
+        # Progress header plus ghost diff, mounted in one pass
+        widgets = [
+            Static(f"\n[#7dcfff]Provisioning skill: {meta.name}[/]"),
+            pb,
+            status,
+            Static("\n[bold #7dcfff]Ghost Preview — Files to Create:[/]"),
+        ]
         for entry in plan.entries:
-            icon = "📁" if not Path(entry.path).suffix else "📄"
-            area.mount(Static(f"  [#9ece6a]{icon} {Path(entry.path).name}[/]  [#565f89]{entry.description}[/]"))
+            _, name, has_suffix = split_entry_path(entry.path)
+            icon = "📄" if has_suffix else "📁"
+            widgets.append(Static(f"  [#9ece6a]{icon} {name}[/]  [#565f89]{entry.description}[/]"))
+        await area.mount_all(widgets)
 
         await asyncio.sleep(0.5)
         status.update("[#7aa2f7]Writing files...[/]")
 
-        def on_progress(msg: str, pct: float) -> None:
+        def show_progress(msg: str, pct: float) -> None:
             pb.progress = int(pct * 100)
             status.update(f"[#7aa2f7]{msg}[/]")
 
-        success = self.provisioner.execute_skill_creation(plan, on_progress)
+        # Files are written in a thread; progress is handed back to the event loop
+        loop = asyncio.get_running_loop()
+
+        def on_progress(msg: str, pct: float) -> None:
+            loop.call_soon_threadsafe(show_progress, msg, pct)
+
+        success = await start_guarded_write(
+            self.provisioner, PROVISION_WRITE, self.provisioner.execute_skill_creation, plan, on_progress
+        )
         await asyncio.sleep(0.3)
 
         if success:
@@ -343,17 +423,27 @@ class SkillFactoryScreen(Container):
             self.app.notify("Skill creation failed", severity="error")
 
     def _refresh_preview(self) -> None:
+        # An unbuilt preview tab renders the selection when it is first shown
+        if self._preview_title is not None:
+            self._render_preview()
         try:
-            tabs = self.query_one("#skill-tabs", TabbedContent)
-            tab = tabs.query_one("#tab-preview")
-            tab.remove_children()
-            tab.mount(self._build_preview_tab())
-            tabs.active = "tab-preview"
+            self.query_one("#skill-tabs", TabbedContent).active = "tab-preview"
         except Exception:
             pass
 
+    def _set_skill_scope(self, scope: str) -> None:
+        self._skill_scope = scope
+        for btn_scope, btn in self._scope_buttons.items():
+            btn.set_class(btn_scope == scope, "btn-primary")
+            btn.set_class(btn_scope != scope, "btn-ghost")
+        target = self._local_skills_dir() if scope == "local" else self.vault.skills_dir
+        self._scope_label.update(f"[#565f89]→ {target}[/]")
+
+    def _local_skills_dir(self) -> Path:
+        return self._cwd / self.vault.load().project_skills_subdir
+
     def _copy_to_project(self, skill_name: str) -> None:
-        cwd = Path(os.getcwd())
+        cwd = self._cwd
         plan = self.provisioner.copy_skill_to_project(skill_name, cwd)
         ok, msg = self.provisioner.execute_plan(plan)
         if ok:
@@ -363,10 +453,24 @@ class SkillFactoryScreen(Container):
             self.app.notify(f"Copy failed: {msg}", severity="error")
 
     def _delete_skill(self, skill_name: str) -> None:
+        self.run_delete_skill(skill_name)
+
+    @work(group="delete")
+    async def run_delete_skill(self, skill_name: str) -> None:
         import shutil
         skill_path = self.vault.skills_dir / skill_name
+        card = self.query_one(f"#card-{skill_name}")
+        button = card.query_one(f"#delete-{skill_name}", Button)
+        button.disabled = True
+        button.label = "🗑 Deleting..."
         try:
-            shutil.rmtree(skill_path)
-            self.app.notify(f"✓ Skill '{skill_name}' deleted", severity="information")
+            await asyncio.to_thread(shutil.rmtree, skill_path)
         except Exception as e:
+            button.disabled = False
+            button.label = "🗑 Delete"
             self.app.notify(f"Delete failed: {e}", severity="error")
+            return
+        await card.remove()
+        self._registry_total -= 1
+        self._set_registry_count()
+        self.app.notify(f"✓ Skill '{skill_name}' deleted", severity="information")
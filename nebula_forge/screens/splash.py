@@ -7,9 +7,7 @@ from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.widgets import Static, ProgressBar, Label
 from textual.containers import Center, Middle, Vertical
-from textual import work
 from rich.text import Text
-import asyncio
 
 NEBULA_ASCII = r"""
 ███╗   ██╗███████╗██████╗ ██╗   ██╗██╗      █████╗        
@@ -36,6 +34,7 @@ BOOT_STEPS = [
     ("◈ Heating up Reasoning Core...   ", 0.85),
     ("◈ Nebula Forge is ready.         ", 1.00),
 ]
+BOOT_STEP_INTERVAL = 0.22
 
 
 def _colorize_ascii(text: str) -> Text:
@@ -56,6 +55,10 @@ def _colorize_ascii(text: str) -> Text:
     return rich_text
 
 
+# The banner never changes, so it is colored once at import
+SPLASH_ASCII = _colorize_ascii(NEBULA_ASCII)
+
+
 class SplashScreen(Screen):
     CSS_PATH = "../themes/tokyo_night.tcss"
 
@@ -64,7 +67,7 @@ class SplashScreen(Screen):
     def compose(self) -> ComposeResult:
         with Middle(id="splash-screen"):
             with Center():
-                yield Static(_colorize_ascii(NEBULA_ASCII), id="splash-ascii")
+                yield Static(SPLASH_ASCII, id="splash-ascii")
             with Center():
                 yield Static(
                     "  ◆  The Agentic Orchestrator  ·  v1.0.0  ◆",
@@ -79,17 +82,21 @@ class SplashScreen(Screen):
                 yield ProgressBar(total=100, show_eta=False, id="splash-progress")
 
     def on_mount(self) -> None:
-        self.run_boot_sequence()
+        self._progress = self.query_one("#splash-progress", ProgressBar)
+        self._status = self.query_one("#splash-status", Static)
+        self._boot_step = 0
+        # First step shows now; one interval tick per remaining step, then "ready"
+        self._advance_boot()
+        self.set_interval(BOOT_STEP_INTERVAL, self._advance_boot, repeat=len(BOOT_STEPS))
 
-    @work(exclusive=True)
-    async def run_boot_sequence(self) -> None:
-        progress = self.query_one("#splash-progress", ProgressBar)
-        status = self.query_one("#splash-status", Static)
-        for msg, pct in BOOT_STEPS:
-            status.update(f"[#565f89]{msg}[/]")
-            progress.progress = int(pct * 100)
-            await asyncio.sleep(0.22)
-        status.update("[#9ece6a]✓ System ready — press ENTER to launch[/]")
+    def _advance_boot(self) -> None:
+        if self._boot_step == len(BOOT_STEPS):
+            self._status.update("[#9ece6a]✓ System ready — press ENTER to launch[/]")
+            return
+        msg, pct = BOOT_STEPS[self._boot_step]
+        self._status.update(f"[#565f89]{msg}[/]")
+        self._progress.progress = int(pct * 100)
+        self._boot_step += 1
 
     def action_dismiss_splash(self) -> None:
         self.app.pop_screen()
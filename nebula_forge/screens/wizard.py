@@ -131,8 +131,9 @@ class WizardScreen(Screen):
             ("anthropic", "Anthropic  [#565f89](optional — Claude via API)[/]", "sk-ant-..."),
             ("nvidia", "NVIDIA NIM  [#565f89](optional — free 1000 calls/month)[/]", "nvapi-..."),
         ]
+        widgets = []
         for key, label, ph in fields:
-            body.mount(Static(label, classes="form-label"))
+            widgets.append(Static(label, classes="form-label"))
             inp = Input(
                 placeholder=ph,
                 password=True,
@@ -141,29 +142,32 @@ class WizardScreen(Screen):
             )
             if self._form_data.get(key):
                 inp.value = self._form_data[key]
-            body.mount(inp)
+            widgets.append(inp)
+        body.mount_all(widgets)
 
     def _render_workspace(self, body) -> None:
-        body.mount(Static("Global Base Path  [#565f89](parent of your projects)[/]", classes="form-label"))
-        body.mount(Input(
-            value=self._form_data["base_path"],
-            id="inp-base-path",
-            classes="form-row",
-        ))
-        body.mount(Static("Default Model", classes="form-label"))
-        body.mount(Select(
-            options=MODELS,
-            value=self._form_data["default_model"],
-            id="sel-model",
-        ))
-        body.mount(Static(
-            "\n[#565f89]Directory structure that will be created:[/]\n"
-            "[#9ece6a]  ~/.nebula-forge/vault.json[/]\n"
-            "[#9ece6a]  ~/.claude/skills/[/]\n"
-            "[#9ece6a]  ~/.nebula/agents/[/]\n"
-            "[#9ece6a]  ~/.nebula/logs/[/]\n"
-            "[#9ece6a]  ~/.nebula/blueprints/[/]"
-        ))
+        body.mount_all([
+            Static("Global Base Path  [#565f89](parent of your projects)[/]", classes="form-label"),
+            Input(
+                value=self._form_data["base_path"],
+                id="inp-base-path",
+                classes="form-row",
+            ),
+            Static("Default Model", classes="form-label"),
+            Select(
+                options=MODELS,
+                value=self._form_data["default_model"],
+                id="sel-model",
+            ),
+            Static(
+                "\n[#565f89]Directory structure that will be created:[/]\n"
+                "[#9ece6a]  ~/.nebula-forge/vault.json[/]\n"
+                "[#9ece6a]  ~/.claude/skills/[/]\n"
+                "[#9ece6a]  ~/.nebula/agents/[/]\n"
+                "[#9ece6a]  ~/.nebula/logs/[/]\n"
+                "[#9ece6a]  ~/.nebula/blueprints/[/]"
+            ),
+        ])
 
     def _render_review(self, body) -> None:
         cfg = self._build_config()
@@ -234,12 +238,14 @@ class WizardScreen(Screen):
     @work(exclusive=True)
     async def run_init(self) -> None:
         body = self.query_one("#wizard-body")
-        body.remove_children()
-        body.mount(Static("\n[#7dcfff]Initializing NEBULA-FORGE...[/]"))
+        await body.remove_children()
         pb = ProgressBar(total=100, show_eta=False)
-        body.mount(pb)
         status = Static("[#565f89]Starting...[/]")
-        body.mount(status)
+        await body.mount_all([
+            Static("\n[#7dcfff]Initializing NEBULA-FORGE...[/]"),
+            pb,
+            status,
+        ])
 
         steps = [
             ("Creating vault directory...", 20),
@@ -19,6 +19,14 @@ AGENTS_DIR = Path.home() / ".config" / "opencode" / "agents"
 LOGS_DIR = VAULT_DIR / "logs"
 BLUEPRINTS_DIR = VAULT_DIR / "blueprints"
 
+# APIKeys field → exported environment variable
+ENV_VAR_NAMES = {
+    "google_ai": "GOOGLE_AI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "github_copilot": "GITHUB_COPILOT_TOKEN",
+    "nvidia": "NVIDIA_API_KEY",
+}
+
 
 class Vault:
     """
@@ -158,13 +166,7 @@ class Vault:
         """Generate shell export commands for all set keys."""
         cfg = self.load()
         lines = []
-        mapping = {
-            "google_ai": "GOOGLE_AI_API_KEY",
-            "anthropic": "ANTHROPIC_API_KEY",
-            "github_copilot": "GITHUB_COPILOT_TOKEN",
-            "nvidia": "NVIDIA_API_KEY",
-        }
-        for field, env_var in mapping.items():
+        for field, env_var in ENV_VAR_NAMES.items():
             val = getattr(cfg.api_keys, field, None)
             if val:
                 lines.append(f"export {env_var}={val}")
@@ -175,10 +177,17 @@ class Vault:
     # ── Skill Registry ───────────────────────────────────────
 
     def list_global_skills(self) -> list[Path]:
-        sd = self.skills_dir
-        if not sd.exists():
+        return [Path(e.path) for e in self.scan_global_skills()]
+
+    def scan_global_skills(self) -> list[os.DirEntry]:
+        """Skill directories sorted by name, from a single scandir pass."""
+        try:
+            with os.scandir(self.skills_dir) as it:
+                entries = [e for e in it if e.is_dir()]
+        except OSError:
             return []
-        return [p for p in sd.iterdir() if p.is_dir()]
+        entries.sort(key=lambda e: e.name)
+        return entries
 
     def skill_exists(self, name: str) -> bool:
         return (self.skills_dir / name).exists()